@@ -28,3 +28,7 @@ class MissingPluginNames(Exception):
 
 class AlreadyEndedException(Exception):
     pass
+
+
+class SamplingRequestError(Exception):
+    pass
@@ -1,12 +1,8 @@
 import binascii
 import os
 import time
-from datetime import datetime
-
-import botocore.session
-from botocore import UNSIGNED
-from botocore.client import Config
 
+from .daemon_client import DaemonClient
 from .sampling_rule import SamplingRule
 from aws_xray_sdk.core.models.dummy_entities import DummySegment
 from aws_xray_sdk.core.context import Context
@@ -17,9 +13,12 @@ class ServiceConnector:
     Connector class that translates Centralized Sampling poller functions to
     actual X-Ray back-end APIs and communicates with X-Ray daemon as the
     signing proxy.
+
+    Unless a custom client is supplied, the daemon is called through
+    the lightweight ``DaemonClient`` so botocore is never loaded.
     """
     def __init__(self):
-        self._xray_client = self._create_xray_client()
+        self._xray_client = DaemonClient()
         self._client_id = binascii.b2a_hex(os.urandom(12)).decode('utf-8')
         self._context = Context()
 
@@ -47,7 +46,7 @@ class ServiceConnector:
     @_context_wrapped
     def fetch_sampling_rules(self):
         """
-        Use X-Ray botocore client to get the centralized sampling rules
+        Use the X-Ray client to get the centralized sampling rules
         from X-Ray service. The call is proxied and signed by X-Ray Daemon.
         """
         new_rules = []
@@ -105,7 +104,7 @@ class ServiceConnector:
         will be ignored.
         """
         if not client:
-            client = self._create_xray_client(ip, port)
+            client = DaemonClient(ip, port)
         self._xray_client = client
 
     @property
@@ -145,12 +144,3 @@ class ServiceConnector:
             record.get('ResourceARN', None) == '*' and \
             record.get('ServiceType', None) and \
             not record.get('Attributes', None)
-
-    def _create_xray_client(self, ip='127.0.0.1', port='2000'):
-        session = botocore.session.get_session()
-        url = 'http://%s:%s' % (ip, port)
-        return session.create_client('xray', endpoint_url=url,
-                                     region_name='us-west-2',
-                                     config=Config(signature_version=UNSIGNED),
-                                     aws_access_key_id='', aws_secret_access_key=''
-                                     )
@@ -0,0 +1,97 @@
+import http.client
+import json
+import threading
+from datetime import datetime, timezone
+
+from aws_xray_sdk.core.exceptions.exceptions import SamplingRequestError
+
+DEFAULT_TIMEOUT = 2  # seconds
+
+
+class DaemonHTTPConnection(http.client.HTTPConnection):
+    """
+    Connection used by the sampling pollers. It is a distinct class so
+    the httplib patch can skip tracing the SDK's own calls to the daemon.
+    """
+    pass
+
+
+class DaemonClient:
+    """
+    A minimal client for the unsigned ``GetSamplingRules`` and
+    ``SamplingTargets`` proxy endpoints served by the X-Ray daemon.
+    It sends plain JSON over a single keep-alive connection and returns
+    responses shaped like the botocore X-Ray client's, so it can be used
+    wherever ``ServiceConnector`` expects an ``xray_client``.
+    """
+    def __init__(self, ip='127.0.0.1', port=2000, timeout=DEFAULT_TIMEOUT):
+        self._ip = ip
+        self._port = int(port)
+        self._timeout = timeout
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def get_sampling_rules(self, **kwargs):
+        resp = self._post('/GetSamplingRules', kwargs)
+        for record in resp.get('SamplingRuleRecords', []):
+            self._to_datetime(record, 'CreatedAt', 'ModifiedAt')
+        return resp
+
+    def get_sampling_targets(self, **kwargs):
+        resp = self._post('/SamplingTargets', kwargs)
+        for doc in resp.get('SamplingTargetDocuments', []):
+            self._to_datetime(doc, 'ReservoirQuotaTTL')
+        self._to_datetime(resp, 'LastRuleModification')
+        return resp
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+    @property
+    def ip(self):
+        return self._ip
+
+    @property
+    def port(self):
+        return self._port
+
+    def _post(self, path, body):
+        payload = json.dumps(body).encode('utf-8')
+        headers = {'Content-Type': 'application/json'}
+        with self._lock:
+            try:
+                status, data = self._request(path, payload, headers)
+            except (http.client.HTTPException, OSError):
+                # The daemon may have closed an idle keep-alive
+                # connection, retry once on a fresh one.
+                self._close()
+                status, data = self._request(path, payload, headers)
+
+        if status != 200:
+            raise SamplingRequestError('Request to %s failed with status %s: %s'
+                                       % (path, status, data[:256]))
+        return json.loads(data.decode('utf-8'))
+
+    def _request(self, path, payload, headers):
+        if self._conn is None:
+            self._conn = DaemonHTTPConnection(self._ip, self._port,
+                                              timeout=self._timeout)
+        self._conn.request('POST', path, body=payload, headers=headers)
+        resp = self._conn.getresponse()
+        data = resp.read()
+        if resp.will_close:
+            self._close()
+        return resp.status, data
+
+    def _close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _to_datetime(self, doc, *keys):
+        # The daemon returns timestamps as epoch seconds.
+        for key in keys:
+            value = doc.get(key, None)
+            if isinstance(value, (int, float)):
+                doc[key] = datetime.fromtimestamp(value, tz=timezone.utc)
@@ -6,9 +6,14 @@ class Reservoir:
     """
     Centralized thread-safe reservoir which holds fixed sampling
     quota, borrowed count and TTL.
+
+    Once the quota of the current second is used up, further calls
+    within that second are answered without taking the lock, so
+    threads only contend while there is quota left to hand out.
     """
     def __init__(self):
         self._lock = threading.Lock()
+        self._exhausted_sec = None
 
         self._quota = None
         self._TTL = None
@@ -26,8 +31,14 @@ class Reservoir:
         the reservoir. Return ``False`` if it can neither
         borrow nor take. This method is thread-safe.
         """
+        if self._exhausted_sec == now:
+            return ReservoirDecision.NO
+
         with self._lock:
-            return self._borrow_or_take(now, can_borrow)
+            decision = self._borrow_or_take(now, can_borrow)
+            if decision == ReservoirDecision.NO:
+                self._exhausted_sec = now
+            return decision
 
     def load_quota(self, quota, TTL, interval):
         """
@@ -35,12 +46,15 @@ class Reservoir:
         the reservoir will continue using old quota until it
         expires or has a non-None quota/TTL in a future load.
         """
-        if quota is not None:
-            self._quota = quota
-        if TTL is not None:
-            self._TTL = TTL
-        if interval is not None:
-            self._report_interval = interval / 10
+        with self._lock:
+            # New quota may leave room in the current second.
+            self._exhausted_sec = None
+            if quota is not None:
+                self._quota = quota
+            if TTL is not None:
+                self._TTL = TTL
+            if interval is not None:
+                self._report_interval = interval / 10
 
     @property
     def quota(self):
@@ -1,29 +1,45 @@
 import threading
 from operator import attrgetter
 
+from aws_xray_sdk.core.utils.lru_cache import LRUCache
+
 TTL = 60 * 60  # The cache expires 1 hour after the last refresh time.
+MATCH_CACHE_SIZE = 1024  # Maximum number of distinct request shapes remembered.
+
+_MISSING = object()
 
 
 class RuleCache:
     """
     Cache sampling rules and quota retrieved by ``TargetPoller``
     and ``RulePoller``. It will not return anything if it expires.
+
+    The rule matched for each distinct request shape is remembered
+    in a bounded LRU cache so repeated requests skip the wildcard
+    matching. Only the rule lookup is cached, reservoir and rate
+    decisions are still made per request.
     """
-    def __init__(self):
+    def __init__(self, match_cache_size=MATCH_CACHE_SIZE):
 
         self._last_updated = None
-        self._rules = []
+        # Rules and the generation of the match cache they belong to are
+        # swapped together so lookups never mix new rules with old matches.
+        self._rules_state = ([], 0)
+        self._match_cache = LRUCache(match_cache_size)
         self._lock = threading.Lock()
 
     def get_matched_rule(self, sampling_req, now):
         if self._is_expired(now):
+            if len(self._match_cache):
+                self._invalidate_match_cache()
             return None
-        matched_rule = None
-        for rule in self.rules:
-            if(not matched_rule and rule.match(sampling_req)):
-                matched_rule = rule
-            if(not matched_rule and rule.is_default()):
-                matched_rule = rule
+
+        rules, generation = self._rules_state
+        key = (generation, self._match_key(sampling_req))
+        matched_rule = self._match_cache.get(key, _MISSING)
+        if matched_rule is _MISSING:
+            matched_rule = self._match(rules, sampling_req)
+            self._match_cache.put(key, matched_rule)
         return matched_rule
 
     def load_rules(self, rules):
@@ -35,11 +51,39 @@ class RuleCache:
         with self._lock:
             self._load_targets(targets_dict)
 
+    def _match(self, rules, sampling_req):
+        matched_rule = None
+        for rule in rules:
+            if(not matched_rule and rule.match(sampling_req)):
+                matched_rule = rule
+            if(not matched_rule and rule.is_default()):
+                matched_rule = rule
+        return matched_rule
+
+    def _match_key(self, sampling_req):
+        if sampling_req is None:
+            return None
+        return (sampling_req.get('host', None),
+                sampling_req.get('method', None),
+                sampling_req.get('path', None),
+                sampling_req.get('service', None),
+                sampling_req.get('service_type', None))
+
+    def _invalidate_match_cache(self):
+        rules, generation = self._rules_state
+        self._rules_state = (rules, generation + 1)
+        self._match_cache.clear()
+
     def _load_rules(self, rules):
         oldRules = {}
         for rule in self.rules:
             oldRules[rule.name] = rule
 
+        # The cache should maintain the order of the rules based on
+        # priority. If priority is the same we sort name by alphabet
+        # as rule name is unique.
+        rules.sort(key=attrgetter('priority', 'name'))
+
         # Update the rules in the cache.
         self.rules = rules
 
@@ -49,11 +93,6 @@ class RuleCache:
             if old:
                 rule.merge(old)
 
-        # The cache should maintain the order of the rules based on
-        # priority. If priority is the same we sort name by alphabet
-        # as rule name is unique.
-        self.rules.sort(key=attrgetter('priority', 'name'))
-
     def _load_targets(self, targets_dict):
         for rule in self.rules:
             target = targets_dict.get(rule.name, None)
@@ -71,11 +110,12 @@ class RuleCache:
 
     @property
     def rules(self):
-        return self._rules
+        return self._rules_state[0]
 
     @rules.setter
     def rules(self, v):
-        self._rules = v
+        self._rules_state = (v, self._rules_state[1] + 1)
+        self._match_cache.clear()
 
     @property
     def last_updated(self):
@@ -84,3 +124,11 @@ class RuleCache:
     @last_updated.setter
     def last_updated(self, v):
         self._last_updated = v
+
+    @property
+    def match_cache_hits(self):
+        return self._match_cache.hits
+
+    @property
+    def match_cache_misses(self):
+        return self._match_cache.misses
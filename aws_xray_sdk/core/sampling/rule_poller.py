@@ -1,7 +1,8 @@
 import logging
 from random import Random
 import time
-import threading
+
+from .scheduler import get_scheduler
 
 log = logging.getLogger(__name__)
 
@@ -10,29 +11,25 @@ DEFAULT_INTERVAL = 5 * 60  # 5 minutes on sampling rules fetch
 
 class RulePoller:
 
-    def __init__(self, cache, connector):
+    def __init__(self, cache, connector, scheduler=None):
 
         self._cache = cache
         self._random = Random()
-        self._time_to_wait = 0
-        self._time_elapsed = 0
         self._connector = connector
+        self._scheduler = scheduler or get_scheduler()
+        self._task = None
 
     def start(self):
-        poller_thread = threading.Thread(target=self._worker)
-        poller_thread.daemon = True
-        poller_thread.start()
+        self._task = self._scheduler.schedule(self._worker, name='RulePoller')
+
+    def stop(self):
+        if self._task:
+            self._scheduler.cancel(self._task)
+            self._task = None
 
     def _worker(self):
-        frequency = 1
-        while True:
-            if self._time_elapsed >= self._time_to_wait:
-                self._refresh_cache()
-                self._time_elapsed = 0
-                self._reset_time_to_wait()
-            else:
-                time.sleep(frequency)
-                self._time_elapsed = self._time_elapsed + frequency
+        self._refresh_cache()
+        return self._get_time_to_wait()
 
     def wake_up(self):
         """
@@ -40,7 +37,8 @@ class RulePoller:
         regardless of the polling interval.
         This method is intended to be used by ``TargetPoller`` only.
         """
-        self._time_elapsed = self._time_to_wait + 1000
+        if self._task:
+            self._scheduler.wake_up(self._task)
 
     def _refresh_cache(self):
         try:
@@ -52,10 +50,10 @@ class RulePoller:
         except Exception:
             log.error("Encountered an issue while polling sampling rules.", exc_info=True)
 
-    def _reset_time_to_wait(self):
+    def _get_time_to_wait(self):
         """
         A random jitter of up to 5 seconds is injected after each run
         to ensure the calls eventually get evenly distributed over
         the 5 minute window.
         """
-        self._time_to_wait = DEFAULT_INTERVAL + self._random.random() * 5
+        return DEFAULT_INTERVAL + self._random.random() * 5
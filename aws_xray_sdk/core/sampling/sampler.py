@@ -47,6 +47,18 @@ class DefaultSampler:
                 self._target_poller.start()
                 self._started = True
 
+    def shutdown(self):
+        """
+        Stop polling sampling rules and targets. All pollers share a
+        single scheduler thread which exits once no poller is left.
+        Calling ``start`` again resumes polling.
+        """
+        with self._lock:
+            if self._started:
+                self._rule_poller.stop()
+                self._target_poller.stop()
+                self._started = False
+
     def should_trace(self, sampling_req=None):
         """
         Return the matched sampling rule name if the sampler finds one
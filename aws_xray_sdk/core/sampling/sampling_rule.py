@@ -1,8 +1,41 @@
+import itertools
 import threading
 
 from .reservoir import Reservoir
 from aws_xray_sdk.core.utils.search_pattern import wildcard_match
 
+STATISTICS_STRIPES = 16
+
+
+class _StatisticsStripe:
+    """
+    One stripe of a rule's request/borrow/sampled counters. Threads
+    are spread over the stripes so they don't contend on a single lock.
+    """
+    __slots__ = ('lock', 'request_count', 'borrow_count', 'sampled_count')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.request_count = 0
+        self.borrow_count = 0
+        self.sampled_count = 0
+
+
+# Each thread is assigned a stripe index once, round-robin.
+_stripe_ids = itertools.count()
+_thread_stripe = threading.local()
+
+
+def _stripe_index():
+    try:
+        return _thread_stripe.index
+    except AttributeError:
+        _thread_stripe.index = next(_stripe_ids) % STATISTICS_STRIPES
+        return _thread_stripe.index
+
 
 class SamplingRule:
     """
@@ -23,9 +56,7 @@ class SamplingRule:
         self._service_type = service_type
 
         self._reservoir = Reservoir()
-        self._reset_statistics()
-
-        self._lock = threading.Lock()
+        self._stripes = [_StatisticsStripe() for _ in range(STATISTICS_STRIPES)]
 
     def match(self, sampling_req):
         """
@@ -56,9 +87,11 @@ class SamplingRule:
         """
         Take a snapshot of request/borrow/sampled count for reporting
         back to X-Ray back-end by ``TargetPoller`` and reset those counters.
+        All counter stripes are locked so the merged snapshot is exact.
         """
-        with self._lock:
-
+        for stripe in self._stripes:
+            stripe.lock.acquire()
+        try:
             stats = {
                 'request_count': self.request_count,
                 'borrow_count': self.borrow_count,
@@ -67,24 +100,29 @@ class SamplingRule:
 
             self._reset_statistics()
             return stats
+        finally:
+            for stripe in self._stripes:
+                stripe.lock.release()
 
     def merge(self, rule):
         """
         Migrate all stateful attributes from the old rule
         """
-        with self._lock:
-            self._request_count = rule.request_count
-            self._borrow_count = rule.borrow_count
-            self._sampled_count = rule.sampled_count
-            self._reservoir = rule.reservoir
-            rule.reservoir = None
+        stats = rule.snapshot_statistics()
+        stripe = self._stripes[0]
+        with stripe.lock:
+            stripe.request_count += stats['request_count']
+            stripe.borrow_count += stats['borrow_count']
+            stripe.sampled_count += stats['sampled_count']
+        self._reservoir = rule.reservoir
+        rule.reservoir = None
 
     def ever_matched(self):
         """
         Returns ``True`` if this sample rule has ever been matched
         with an incoming request within the reporting interval.
         """
-        return self._request_count > 0
+        return self.request_count > 0
 
     def time_to_report(self):
         """
@@ -94,21 +132,23 @@ class SamplingRule:
         return self.reservoir._time_to_report()
 
     def increment_request_count(self):
-        with self._lock:
-            self._request_count += 1
+        stripe = self._stripes[_stripe_index()]
+        with stripe.lock:
+            stripe.request_count += 1
 
     def increment_borrow_count(self):
-        with self._lock:
-            self._borrow_count += 1
+        stripe = self._stripes[_stripe_index()]
+        with stripe.lock:
+            stripe.borrow_count += 1
 
     def increment_sampled_count(self):
-        with self._lock:
-            self._sampled_count += 1
+        stripe = self._stripes[_stripe_index()]
+        with stripe.lock:
+            stripe.sampled_count += 1
 
     def _reset_statistics(self):
-        self._request_count = 0
-        self._borrow_count = 0
-        self._sampled_count = 0
+        for stripe in self._stripes:
+            stripe.reset()
 
     @property
     def rate(self):
@@ -140,12 +180,12 @@ class SamplingRule:
 
     @property
     def request_count(self):
-        return self._request_count
+        return sum(stripe.request_count for stripe in self._stripes)
 
     @property
     def borrow_count(self):
-        return self._borrow_count
+        return sum(stripe.borrow_count for stripe in self._stripes)
 
     @property
     def sampled_count(self):
-        return self._sampled_count
+        return sum(stripe.sampled_count for stripe in self._stripes)
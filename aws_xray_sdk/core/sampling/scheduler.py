@@ -0,0 +1,130 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+log = logging.getLogger(__name__)
+
+
+class ScheduledTask:
+    """
+    A unit of work registered with ``PollScheduler``. The callable
+    returns the delay in seconds until its next run, or ``None``
+    to stop being scheduled.
+    """
+    def __init__(self, func, name=None):
+        self.func = func
+        self.name = name or getattr(func, '__name__', 'task')
+        self.deadline = None
+        self.cancelled = False
+
+
+class PollScheduler:
+    """
+    Runs the periodic work of all sampling pollers on a single daemon
+    thread. Tasks are kept in a heap ordered by deadline and the thread
+    sleeps exactly until the earliest one is due, or until a task is
+    rescheduled through ``wake_up``. The thread exits once there is
+    nothing left to run and is started again on demand.
+    """
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._queue = []
+        self._seq = itertools.count()
+        self._thread = None
+
+    def schedule(self, func, delay=0, name=None):
+        """
+        Register ``func`` to run ``delay`` seconds from now and
+        return its ``ScheduledTask`` handle.
+        """
+        task = ScheduledTask(func, name)
+        with self._cond:
+            self._push(task, delay)
+        return task
+
+    def wake_up(self, task):
+        """
+        Run a scheduled task as soon as possible regardless of its deadline.
+        """
+        with self._cond:
+            if not task.cancelled:
+                self._push(task, 0)
+
+    def cancel(self, task):
+        with self._cond:
+            task.cancelled = True
+            self._cond.notify()
+
+    def shutdown(self, timeout=None):
+        """
+        Cancel all tasks and wait for the scheduler thread to exit.
+        """
+        with self._cond:
+            for _, _, task in self._queue:
+                task.cancelled = True
+            self._queue = []
+            thread = self._thread
+            self._cond.notify()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def _push(self, task, delay):
+        # Rescheduling leaves the old heap entry behind; it is skipped
+        # later because its deadline no longer matches the task's.
+        task.deadline = time.monotonic() + delay
+        heapq.heappush(self._queue, (task.deadline, next(self._seq), task))
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._worker,
+                                            name='xray-sampling-poller')
+            self._thread.daemon = True
+            self._thread.start()
+        self._cond.notify()
+
+    def _next_due(self):
+        with self._cond:
+            while True:
+                while self._queue and self._is_stale(self._queue[0]):
+                    heapq.heappop(self._queue)
+                if not self._queue:
+                    self._thread = None
+                    return None
+                deadline, _, task = self._queue[0]
+                delay = deadline - time.monotonic()
+                if delay <= 0:
+                    heapq.heappop(self._queue)
+                    return task
+                self._cond.wait(delay)
+
+    def _is_stale(self, entry):
+        deadline, _, task = entry
+        return task.cancelled or task.deadline != deadline
+
+    def _worker(self):
+        while True:
+            task = self._next_due()
+            if task is None:
+                return
+            try:
+                delay = task.func()
+            except Exception:
+                log.error("Encountered an issue while running %s.", task.name, exc_info=True)
+                continue
+            with self._cond:
+                if delay is not None and not task.cancelled:
+                    self._push(task, delay)
+
+
+_scheduler = PollScheduler()
+
+
+def get_scheduler():
+    """
+    Return the scheduler shared by every ``DefaultSampler`` in the process.
+    """
+    return _scheduler
@@ -1,7 +1,7 @@
 import logging
 from random import Random
-import time
-import threading
+
+from .scheduler import get_scheduler
 
 log = logging.getLogger(__name__)
 
@@ -12,25 +12,31 @@ class TargetPoller:
     centralized sampling rules and retrieve the new allocated
     sampling quota and TTL from X-Ray service.
     """
-    def __init__(self, cache, rule_poller, connector):
+    def __init__(self, cache, rule_poller, connector, scheduler=None):
         self._cache = cache
         self._rule_poller = rule_poller
         self._connector = connector
         self._random = Random()
         self._interval = 10 # default 10 seconds interval on sampling targets fetch
+        self._scheduler = scheduler or get_scheduler()
+        self._task = None
 
     def start(self):
-        poller_thread = threading.Thread(target=self._worker)
-        poller_thread.daemon = True
-        poller_thread.start()
+        self._task = self._scheduler.schedule(self._worker,
+                                              self._interval + self._get_jitter(),
+                                              name='TargetPoller')
+
+    def stop(self):
+        if self._task:
+            self._scheduler.cancel(self._task)
+            self._task = None
 
     def _worker(self):
-        while True:
-            try:
-                time.sleep(self._interval + self._get_jitter())
-                self._do_work()
-            except Exception:
-                log.error("Encountered an issue while polling targets.", exc_info=True)
+        try:
+            self._do_work()
+        except Exception:
+            log.error("Encountered an issue while polling targets.", exc_info=True)
+        return self._interval + self._get_jitter()
 
     def _do_work(self):
         candidates = self._get_candidates(self._cache.rules)
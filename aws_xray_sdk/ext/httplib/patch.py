@@ -38,6 +38,8 @@ def reset_ignored():
 def _ignored_add_default():
     # skip httplib tracing for SDK built-in centralized sampling pollers
     add_ignored(subclass='botocore.awsrequest.AWSHTTPConnection', urls=['/GetSamplingRules', '/SamplingTargets'])
+    add_ignored(subclass='aws_xray_sdk.core.sampling.daemon_client.DaemonHTTPConnection',
+                urls=['/GetSamplingRules', '/SamplingTargets'])
 
 
 # make sure we have the default rules
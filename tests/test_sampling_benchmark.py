@@ -0,0 +1,36 @@
+import threading
+import time
+
+from aws_xray_sdk.core.sampling.sampler import DefaultSampler
+from aws_xray_sdk.core.sampling.sampling_rule import SamplingRule
+
+THREADS = 64
+CALLS_PER_THREAD = 200
+
+
+def _hot_rule():
+    rule = SamplingRule(name='hot', priority=1, rate=0.05, reservoir_size=10)
+    rule.reservoir.load_quota(quota=10, TTL=int(time.time()) + 3600, interval=None)
+    return rule
+
+
+# Every thread samples through the same hot rule, which used to
+# serialize on the rule and reservoir locks.
+def test_process_matched_rule_contention(benchmark):
+    sampler = DefaultSampler()
+    rule = _hot_rule()
+
+    def worker():
+        for _ in range(CALLS_PER_THREAD):
+            sampler._process_matched_rule(rule, int(time.time()))
+
+    def run():
+        threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return rule.snapshot_statistics()
+
+    stats = benchmark(run)
+    assert stats['request_count'] == THREADS * CALLS_PER_THREAD
@@ -0,0 +1,142 @@
+import json
+import sys
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from aws_xray_sdk.core.exceptions.exceptions import SamplingRequestError
+from aws_xray_sdk.core.sampling.connector import ServiceConnector
+from aws_xray_sdk.core.sampling.daemon_client import DaemonClient
+from aws_xray_sdk.core.sampling.sampling_rule import SamplingRule
+
+RULES_RESPONSE = {
+    'SamplingRuleRecords': [
+        {
+            'SamplingRule': {
+                'RuleName': 'Default',
+                'RuleARN': 'arn',
+                'ResourceARN': '*',
+                'Priority': 10000,
+                'FixedRate': 0.05,
+                'ReservoirSize': 1,
+                'ServiceName': '*',
+                'ServiceType': '*',
+                'Host': '*',
+                'HTTPMethod': '*',
+                'URLPath': '*',
+                'Version': 1,
+                'Attributes': {},
+            },
+            'CreatedAt': 0.0,
+            'ModifiedAt': 1530000000.0,
+        },
+    ],
+}
+
+TARGETS_RESPONSE = {
+    'SamplingTargetDocuments': [
+        {
+            'RuleName': 'Default',
+            'FixedRate': 0.1,
+            'ReservoirQuota': 3,
+            'ReservoirQuotaTTL': 1700000000.0,
+            'Interval': 10,
+        },
+    ],
+    'LastRuleModification': 1600000000.0,
+    'UnprocessedStatistics': [],
+}
+
+
+class _DaemonHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        self.server.requests.append((self.path, body))
+        self.server.connections.add(self.client_address)
+        if self.path == '/GetSamplingRules':
+            self._reply(200, RULES_RESPONSE)
+        elif self.path == '/SamplingTargets':
+            self._reply(200, TARGETS_RESPONSE)
+        else:
+            self._reply(404, {'message': 'not found'})
+
+    def _reply(self, status, doc):
+        data = json.dumps(doc).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def daemon():
+    server = HTTPServer(('127.0.0.1', 0), _DaemonHandler)
+    server.requests = []
+    server.connections = set()
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_sampling_rules(daemon):
+    client = DaemonClient('127.0.0.1', daemon.server_port)
+    resp = client.get_sampling_rules()
+
+    assert daemon.requests == [('/GetSamplingRules', {})]
+    record = resp['SamplingRuleRecords'][0]
+    assert record['SamplingRule']['RuleName'] == 'Default'
+    assert record['ModifiedAt'] == datetime(2018, 6, 26, 7, 0, tzinfo=timezone.utc)
+
+
+def test_connection_is_kept_alive(daemon):
+    client = DaemonClient('127.0.0.1', daemon.server_port)
+    client.get_sampling_rules()
+    client.get_sampling_targets(SamplingStatisticsDocuments=[])
+
+    assert len(daemon.requests) == 2
+    assert len(daemon.connections) == 1
+    client.close()
+
+
+def test_error_status_raises(daemon):
+    client = DaemonClient('127.0.0.1', daemon.server_port)
+    with pytest.raises(SamplingRequestError):
+        client._post('/Unknown', {})
+
+
+def test_connector_uses_daemon_client(daemon):
+    connector = ServiceConnector()
+    connector.setup_xray_client('127.0.0.1', daemon.server_port, None)
+
+    rules = connector.fetch_sampling_rules()
+    assert len(rules) == 1
+    assert rules[0].is_default()
+
+    rule = SamplingRule(name='Default', priority=10000, rate=0.05, reservoir_size=1)
+    rule.increment_request_count()
+    targets, last_modified = connector.fetch_sampling_target([rule])
+
+    path, body = daemon.requests[-1]
+    assert path == '/SamplingTargets'
+    assert body['SamplingStatisticsDocuments'][0]['RequestCount'] == 1
+    assert targets['Default'] == {'rate': 0.1, 'quota': 3, 'TTL': 1700000000, 'interval': 10}
+    assert last_modified == 1600000000
+
+
+def test_botocore_not_imported_without_custom_client():
+    # The default connector must not pull in botocore at all.
+    import aws_xray_sdk.core.sampling.connector as connector_module
+    assert 'botocore' not in vars(connector_module)
+    assert 'botocore.session' not in sys.modules or \
+        not isinstance(ServiceConnector()._xray_client, type(sys.modules['botocore.session']))
@@ -0,0 +1,79 @@
+import threading
+import time
+
+from aws_xray_sdk.core.sampling.reservoir import Reservoir, ReservoirDecision
+from aws_xray_sdk.core.sampling.sampling_rule import SamplingRule
+
+THREADS = 16
+CALLS_PER_THREAD = 500
+
+
+def _run_in_threads(target):
+    threads = [threading.Thread(target=target) for _ in range(THREADS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+def test_quota_is_exact_under_contention():
+    reservoir = Reservoir()
+    now = int(time.time())
+    reservoir.load_quota(quota=7, TTL=now + 60, interval=None)
+    decisions = []
+
+    def worker():
+        for _ in range(CALLS_PER_THREAD):
+            decisions.append(reservoir.borrow_or_take(now, True))
+
+    _run_in_threads(worker)
+
+    assert decisions.count(ReservoirDecision.TAKE) == 7
+    assert decisions.count(ReservoirDecision.NO) == THREADS * CALLS_PER_THREAD - 7
+
+
+def test_borrow_once_per_second():
+    reservoir = Reservoir()
+    now = int(time.time())
+
+    assert reservoir.borrow_or_take(now, True) == ReservoirDecision.BORROW
+    assert reservoir.borrow_or_take(now, True) == ReservoirDecision.NO
+    assert reservoir.borrow_or_take(now + 1, True) == ReservoirDecision.BORROW
+
+
+def test_new_quota_reopens_exhausted_second():
+    reservoir = Reservoir()
+    now = int(time.time())
+    reservoir.load_quota(quota=1, TTL=now + 60, interval=None)
+
+    assert reservoir.borrow_or_take(now, False) == ReservoirDecision.TAKE
+    assert reservoir.borrow_or_take(now, False) == ReservoirDecision.NO
+
+    reservoir.load_quota(quota=2, TTL=None, interval=None)
+    assert reservoir.borrow_or_take(now, False) == ReservoirDecision.TAKE
+    assert reservoir.borrow_or_take(now, False) == ReservoirDecision.NO
+
+
+def test_striped_statistics_are_merged_on_snapshot():
+    rule = SamplingRule(name='a', priority=1, rate=0.1, reservoir_size=1)
+
+    def worker():
+        for _ in range(CALLS_PER_THREAD):
+            rule.increment_request_count()
+            rule.increment_sampled_count()
+        rule.increment_borrow_count()
+
+    _run_in_threads(worker)
+
+    assert rule.ever_matched()
+    stats = rule.snapshot_statistics()
+    assert stats['request_count'] == THREADS * CALLS_PER_THREAD
+    assert stats['sampled_count'] == THREADS * CALLS_PER_THREAD
+    assert stats['borrow_count'] == THREADS
+
+    assert not rule.ever_matched()
+    assert rule.snapshot_statistics() == {
+        'request_count': 0,
+        'borrow_count': 0,
+        'sampled_count': 0,
+    }
@@ -136,3 +136,70 @@ def test_expired_cache():
     cache.last_updated = now
     rule = cache.get_matched_rule(sampling_req, now)
     assert rule.is_default()
+
+
+def test_matched_rule_cached_by_request_shape():
+    cache = RuleCache()
+    now = int(time.time())
+    cache.load_rules([rule_default, rule_1, rule_2, rule_0])
+    cache.last_updated = now
+
+    sampling_req = {'host': 'mydomain.com', 'method': 'GET', 'path': 'myop'}
+    assert cache.get_matched_rule(sampling_req, now).name == 'a'
+    assert cache.match_cache_misses == 1
+    assert cache.match_cache_hits == 0
+
+    assert cache.get_matched_rule(dict(sampling_req), now).name == 'a'
+    assert cache.match_cache_misses == 1
+    assert cache.match_cache_hits == 1
+
+    # A different shape is resolved from scratch.
+    assert cache.get_matched_rule({'path': 'ping'}, now).name == 'b'
+    assert cache.match_cache_misses == 2
+
+
+def test_match_cache_invalidated_on_rule_reload():
+    cache = RuleCache()
+    now = int(time.time())
+    cache.load_rules([rule_default, rule_0])
+    cache.last_updated = now
+
+    sampling_req = {'path': 'ping'}
+    assert cache.get_matched_rule(sampling_req, now).is_default()
+
+    cache.load_rules([rule_default, rule_2])
+    assert cache.get_matched_rule(sampling_req, now).name == 'b'
+    assert cache.match_cache_hits == 0
+
+
+def test_match_cache_invalidated_on_expiry():
+    cache = RuleCache()
+    now = int(time.time())
+    cache.load_rules([rule_default, rule_2])
+    cache.last_updated = now
+
+    sampling_req = {'path': 'ping'}
+    assert cache.get_matched_rule(sampling_req, now).name == 'b'
+
+    cache.last_updated = now - 60 * 60 * 24
+    assert cache.get_matched_rule(sampling_req, now) is None
+
+    cache.last_updated = now
+    assert cache.get_matched_rule(sampling_req, now).name == 'b'
+    assert cache.match_cache_hits == 0
+    assert cache.match_cache_misses == 2
+
+
+def test_match_cache_is_bounded():
+    cache = RuleCache(match_cache_size=2)
+    now = int(time.time())
+    cache.load_rules([rule_default, rule_2])
+    cache.last_updated = now
+
+    for path in ('a', 'b', 'c'):
+        cache.get_matched_rule({'path': path}, now)
+    # 'a' is the least recently used entry and has been evicted.
+    cache.get_matched_rule({'path': 'a'}, now)
+    assert cache.match_cache_hits == 0
+    cache.get_matched_rule({'path': 'c'}, now)
+    assert cache.match_cache_hits == 1
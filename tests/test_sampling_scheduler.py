@@ -0,0 +1,103 @@
+import threading
+import time
+
+from aws_xray_sdk.core.sampling.scheduler import PollScheduler
+from aws_xray_sdk.core.sampling.rule_poller import RulePoller
+from aws_xray_sdk.core.sampling.target_poller import TargetPoller
+from aws_xray_sdk.core.sampling.rule_cache import RuleCache
+
+
+class _StubConnector:
+
+    def __init__(self):
+        self.rule_calls = 0
+        self.polled = threading.Event()
+
+    def fetch_sampling_rules(self):
+        self.rule_calls += 1
+        self.polled.set()
+        return []
+
+
+def test_tasks_run_in_deadline_order():
+    scheduler = PollScheduler()
+    order = []
+    done = threading.Event()
+
+    def make(label, last=False):
+        def run():
+            order.append(label)
+            if last:
+                done.set()
+        return run
+
+    scheduler.schedule(make('late', last=True), 0.2)
+    scheduler.schedule(make('early'), 0.05)
+    assert done.wait(2)
+    assert order == ['early', 'late']
+    scheduler.shutdown(timeout=2)
+    assert not scheduler.running
+
+
+def test_periodic_task_is_rescheduled():
+    scheduler = PollScheduler()
+    runs = []
+    done = threading.Event()
+
+    def run():
+        runs.append(time.monotonic())
+        if len(runs) == 3:
+            done.set()
+            return None
+        return 0.01
+
+    scheduler.schedule(run)
+    assert done.wait(2)
+    scheduler.shutdown(timeout=2)
+    assert len(runs) == 3
+
+
+def test_wake_up_runs_task_before_deadline():
+    scheduler = PollScheduler()
+    ran = threading.Event()
+    task = scheduler.schedule(ran.set, 3600)
+
+    assert not ran.wait(0.05)
+    scheduler.wake_up(task)
+    assert ran.wait(2)
+    scheduler.shutdown(timeout=2)
+
+
+def test_cancelled_task_never_runs():
+    scheduler = PollScheduler()
+    ran = threading.Event()
+    task = scheduler.schedule(ran.set, 0.05)
+    scheduler.cancel(task)
+
+    assert not ran.wait(0.2)
+    scheduler.shutdown(timeout=2)
+
+
+def test_pollers_share_one_thread():
+    scheduler = PollScheduler()
+    connector = _StubConnector()
+    cache = RuleCache()
+    rule_poller = RulePoller(cache, connector, scheduler)
+    target_poller = TargetPoller(cache, rule_poller, connector, scheduler)
+    threads_before = threading.active_count()
+
+    rule_poller.start()
+    target_poller.start()
+    assert connector.polled.wait(2)
+    assert threading.active_count() == threads_before + 1
+
+    # The target poller can force an out-of-band rule refresh.
+    connector.polled.clear()
+    rule_poller.wake_up()
+    assert connector.polled.wait(2)
+    assert connector.rule_calls == 2
+
+    rule_poller.stop()
+    target_poller.stop()
+    scheduler.shutdown(timeout=2)
+    assert not scheduler.running